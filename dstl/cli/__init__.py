@@ -1,5 +1,6 @@
 import typer
 
+from .serve import serve
 from .translate import translate
 
 app = typer.Typer(no_args_is_help=True)
@@ -9,6 +10,9 @@ commands = [translate]
 for command in commands:
     app.command(no_args_is_help=True)(command)
 
+# All serve options are optional, running it without any starts a lazily loading server
+app.command()(serve)
+
 
 @app.callback()
 def main() -> None:
@@ -0,0 +1,61 @@
+from typing import List
+
+import typer
+from wasabi import msg
+
+from ..translate.server import DEFAULT_HOST, DEFAULT_PORT, TranslationServer
+
+
+def serve(
+    models: List[str] = typer.Option(
+        [],
+        "--model",
+        "-m",
+        help="Model to load at startup as model_name_or_path:source_lang:target_lang. Can be repeated.",
+    ),
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    max_batch_size: int = 32,
+    max_latency: float = 0.01,
+    verbose: bool = False,
+) -> None:
+    """Serve translation models from a long-lived local HTTP server
+
+    Args:
+        models (List[str]): MarianMT based models to load at startup, each formatted as
+            model_name_or_path:source_lang:target_lang. e.g. Helsinki-NLP/opus-mt-en-de:en:de
+        host (str): Host to bind to. Defaults to localhost only.
+        port (int): Port to bind to.
+        max_batch_size (int): Maximum number of texts translated in one shared batch.
+        max_latency (float): Seconds to wait for concurrent requests before running a batch.
+        verbose (bool): Log every request.
+    """
+    preload = []
+    for model in models:
+        # Split from the right so model paths may contain ":"
+        parts = model.rsplit(":", 2)
+        if len(parts) != 3 or not all(parts):
+            raise ValueError(
+                f"Invalid --model '{model}'. Expected model_name_or_path:source_lang:target_lang"
+            )
+        preload.append(parts)
+
+    server = TranslationServer(
+        host=host,
+        port=port,
+        max_batch_size=max_batch_size,
+        max_latency=max_latency,
+        verbose=verbose,
+    )
+    for model_name_or_path, source_lang, target_lang in preload:
+        msg.text(f"Loading model '{model_name_or_path}' ({source_lang} -> {target_lang})")
+        server.load(model_name_or_path, source_lang, target_lang)
+        msg.good(f"Loaded model '{model_name_or_path}'")
+
+    msg.good(f"Serving translations at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
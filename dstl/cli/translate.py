@@ -3,7 +3,12 @@ from pathlib import Path
 import srsly
 from wasabi import msg
 
-from ..translate import AzureTranslator, GoogleTranslator, TransformersMarianTranslator
+from ..translate import (
+    AzureTranslator,
+    GoogleTranslator,
+    ServerTranslator,
+    TransformersMarianTranslator,
+)
 from ..translate.base import BaseTranslator
 from ..translate.core import translate_ner_batch
 from ..types import Example, Task, Translator
@@ -32,6 +37,8 @@ def translate(
         force (bool): Force output overwrite and creation.
         task (Task): NLP Task format of the data. 
             e.g. "NER", "Classification". Currently, only "NER" is supported
+        api_key (str): API Key for the Azure or Google translation APIs
+        translate_url (str): URL of a running `dstl serve` translation server
     """
 
     if input_path.suffix != ".jsonl":
@@ -68,6 +75,17 @@ def translate(
                 "No api_key provided. Make sure to provide a valid API key for the Google Cloud Translation API."
             )
         translator = GoogleTranslator(api_key, source_lang=source_lang, target_lang=target_lang)
+    elif translator_class == Translator.SERVER:
+        if not model_name_or_path:
+            raise ValueError(
+                "No model_name_or_path provided. Make sure to provide the model the translation server should use. e.g. Helsinki-NLP/opus_mt_en_ROMANCE"
+            )
+        translator = ServerTranslator(
+            model_name_or_path,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            translate_url=translate_url,
+        )
     else:
         if not model_name_or_path:
             raise ValueError(
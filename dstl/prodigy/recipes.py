@@ -5,7 +5,8 @@ from prodigy.core import connect
 from prodigy.util import set_hashes, split_string
 from wasabi import msg
 
-from ..translate import TransformersMarianTranslator
+from ..translate import ServerTranslator, TransformersMarianTranslator
+from ..translate.base import BaseTranslator
 from ..translate.core import translate_ner_batch
 from ..types import Example
 
@@ -22,6 +23,7 @@ from ..types import Example
     ),
     source_lang=("Source language for translation", "option", "sl", str),
     target_lang=("Target language for translation", "option", "tl", str),
+    server_url=("URL of a running `dstl serve` translation server", "option", "su", str),
     dry=("Perform a dry run", "flag", "D", bool),
 )
 def ner_translate(
@@ -30,11 +32,21 @@ def ner_translate(
     model_name_or_path: str,
     source_lang: str,
     target_lang: str,
+    server_url: str = None,
     dry: bool = False,
 ) -> None:
-    translator = TransformersMarianTranslator(
-        model_name_or_path, source_lang=source_lang, target_lang=target_lang
-    )
+    translator: BaseTranslator
+    if server_url:
+        translator = ServerTranslator(
+            model_name_or_path,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            translate_url=server_url,
+        )
+    else:
+        translator = TransformersMarianTranslator(
+            model_name_or_path, source_lang=source_lang, target_lang=target_lang
+        )
 
     DB = connect()
     for set_id in in_sets:
@@ -1,3 +1,4 @@
 from .azure import AzureTranslator
 from .google import GoogleTranslator
+from .server import ServerTranslator, TranslationServer
 from .transformers import TransformersMarianTranslator
@@ -5,6 +5,11 @@ from typing import Iterable, List, Optional
 class BaseTranslator(ABC):
     """Base Translator interface."""
 
+    # True if a copy of a loaded translator can translate a new language pair
+    # by only changing source_lang and target_lang. The TranslationServer uses
+    # this to share loaded weights across language pairs.
+    retargetable = False
+
     def __init__(self, source_lang: str, target_lang: str):
         """Initialize an instance of BaseTranslator
 
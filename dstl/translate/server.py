@@ -0,0 +1,438 @@
+import copy
+import json
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from spacy.util import minibatch
+from tqdm.auto import tqdm
+
+from .base import BaseTranslator
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8008
+DEFAULT_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+
+# Takes (model_name_or_path, source_lang, target_lang) and returns a loaded translator.
+# Called once per model if the translator is retargetable, otherwise once per
+# model and language pair.
+TranslatorFactory = Callable[[str, str, str], BaseTranslator]
+
+
+def marian_translator_factory(
+    model_name_or_path: str, source_lang: str, target_lang: str
+) -> BaseTranslator:
+    """Default factory used by the TranslationServer to load a model
+
+    Progress bars are disabled since the server translates many small batches.
+
+    Args:
+        model_name_or_path (str): Pretrained model name or path of Marian MT based model
+        source_lang (str): Source language to translate from
+        target_lang (str): Language to translate to
+
+    Returns:
+        BaseTranslator: Loaded TransformersMarianTranslator
+    """
+    from .transformers import TransformersMarianTranslator
+
+    return TransformersMarianTranslator(
+        model_name_or_path, source_lang=source_lang, target_lang=target_lang, show_progress=False
+    )
+
+
+class _PendingRequest:
+    """Texts submitted by a single client waiting to be translated in a shared batch."""
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.translations: List[str] = []
+        self.error: Optional[Exception] = None
+        self.done = threading.Event()
+
+
+class _Batcher:
+    """Coalesces concurrent requests for one translator into shared micro-batches.
+
+    A single worker thread waits for the first pending request, then keeps
+    collecting requests until either `max_batch_size` texts are queued or
+    `max_latency` seconds have passed. All collected texts are translated
+    with one call to the translator and the results are split back out.
+    """
+
+    def __init__(
+        self,
+        translator: BaseTranslator,
+        lock: threading.Lock,
+        max_batch_size: int,
+        max_latency: float,
+    ):
+        self.translator = translator
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._lock = lock
+        self._closed = False
+        self._submit_lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[_PendingRequest]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, texts: List[str]) -> List[str]:
+        """Queue texts for translation and block until they are translated
+
+        Args:
+            texts (List[str]): Texts to translate in source language
+
+        Returns:
+            List[str]: Translated texts in target language
+        """
+        request = _PendingRequest(texts)
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("Translation server is shutting down")
+            self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.translations
+
+    def close(self) -> None:
+        with self._submit_lock:
+            self._closed = True
+
+        # Fail requests that haven't been picked up yet so clients aren't left waiting
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is not None:
+                request.error = RuntimeError("Translation server is shutting down")
+                request.done.set()
+
+        self._queue.put(None)
+        self._worker.join()
+
+    def _collect(self, first: _PendingRequest) -> Tuple[List[_PendingRequest], bool]:
+        batch = [first]
+        n_texts = len(first.texts)
+        deadline = time.monotonic() + self.max_latency
+        while n_texts < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                return batch, True
+            batch.append(request)
+            n_texts += len(request.texts)
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch, stop = self._collect(first)
+
+            texts = [text for request in batch for text in request.texts]
+            try:
+                with self._lock:
+                    translations = list(self.translator.pipe(texts, self.max_batch_size))
+                if len(translations) != len(texts):
+                    raise RuntimeError(
+                        f"Translator returned {len(translations)} translations for {len(texts)} texts"
+                    )
+            except Exception as e:
+                for request in batch:
+                    request.error = e
+                    request.done.set()
+                continue
+
+            offset = 0
+            for request in batch:
+                request.translations = translations[offset : offset + len(request.texts)]
+                offset += len(request.texts)
+                request.done.set()
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _TranslationRequestHandler(BaseHTTPRequestHandler):
+    server: "_ThreadingHTTPServer"
+
+    def _send_json(self, status: int, data: Dict[str, Any]) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path != "/health":
+            self._send_json(404, {"error": f"Unknown path '{self.path}'"})
+            return
+        translation_server: TranslationServer = self.server.translation_server  # type: ignore
+        self._send_json(200, {"status": "ok", "models": translation_server.loaded_models})
+
+    def do_POST(self) -> None:
+        if self.path != "/translate":
+            self._send_json(404, {"error": f"Unknown path '{self.path}'"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            data = json.loads(self.rfile.read(length))
+            model_name_or_path = data["model_name_or_path"]
+            source_lang = data["source_lang"]
+            target_lang = data["target_lang"]
+            texts = data["texts"]
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                raise ValueError("texts must be a list of strings")
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {"error": f"Invalid request body: {e}"})
+            return
+
+        translation_server: TranslationServer = self.server.translation_server  # type: ignore
+        try:
+            translations = translation_server.translate(
+                texts, model_name_or_path, source_lang, target_lang
+            )
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+
+        self._send_json(200, {"translations": translations})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.translation_server.verbose:  # type: ignore
+            super().log_message(format, *args)
+
+
+class TranslationServer:
+    """TranslationServer is a long-lived local HTTP server that keeps translation
+    models resident in memory and coalesces concurrent requests from several
+    clients into shared micro-batches."""
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        max_batch_size: int = 32,
+        max_latency: float = 0.01,
+        translator_factory: TranslatorFactory = marian_translator_factory,
+        verbose: bool = False,
+    ):
+        """Initialize an instance of TranslationServer
+
+        Args:
+            host (str, optional): Host to bind to. Defaults to localhost only.
+            port (int, optional): Port to bind to. Use 0 to pick a free port.
+            max_batch_size (int, optional): Maximum number of texts in a shared batch
+            max_latency (float, optional): Seconds to wait for more requests
+                before running a batch
+            translator_factory (TranslatorFactory, optional): Function taking
+                (model_name_or_path, source_lang, target_lang) and returning a loaded
+                BaseTranslator. Defaults to loading a TransformersMarianTranslator.
+                Loaded weights are only shared across language pairs if the
+                translator is retargetable.
+            verbose (bool, optional): Log every HTTP request
+        """
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.translator_factory = translator_factory
+        self.verbose = verbose
+
+        self._models: Dict[str, Tuple[BaseTranslator, threading.Lock]] = {}
+        self._batchers: Dict[Tuple[str, str, str], _Batcher] = {}
+        self._model_load_locks: Dict[str, threading.Lock] = {}
+        self._load_lock = threading.Lock()
+        self._closed = False
+
+        self._httpd = _ThreadingHTTPServer((host, port), _TranslationRequestHandler)
+        self._httpd.translation_server = self  # type: ignore
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.socket.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def loaded_models(self) -> List[str]:
+        return list(self._models)
+
+    def load(self, model_name_or_path: str, source_lang: str, target_lang: str) -> None:
+        """Load a model ahead of the first request so clients don't pay the cold start
+
+        Args:
+            model_name_or_path (str): Model name or path to load
+            source_lang (str): Source language to translate from
+            target_lang (str): Language to translate to
+        """
+        self._get_batcher(model_name_or_path, source_lang, target_lang)
+
+    def translate(
+        self, texts: List[str], model_name_or_path: str, source_lang: str, target_lang: str
+    ) -> List[str]:
+        """Translate texts, sharing a batch with any other concurrent requests
+        for the same model and language pair
+
+        Args:
+            texts (List[str]): Texts to translate in source language
+            model_name_or_path (str): Model name or path to translate with
+            source_lang (str): Source language to translate from
+            target_lang (str): Language to translate to
+
+        Returns:
+            List[str]: Translated texts in target language
+        """
+        self._check_open()
+        if not texts:
+            return []
+        batcher = self._get_batcher(model_name_or_path, source_lang, target_lang)
+        return batcher.submit(texts)
+
+    def _get_batcher(self, model_name_or_path: str, source_lang: str, target_lang: str) -> _Batcher:
+        key = (model_name_or_path, source_lang, target_lang)
+        batcher = self._batchers.get(key)
+        if batcher is not None:
+            return batcher
+
+        with self._load_lock:
+            self._check_open()
+            model_load_lock = self._model_load_locks.setdefault(
+                model_name_or_path, threading.Lock()
+            )
+
+        # Models are loaded under a per model lock so clients of models that
+        # are already loaded aren't blocked while a new model loads
+        with model_load_lock:
+            with self._load_lock:
+                self._check_open()
+                if key in self._batchers:
+                    return self._batchers[key]
+                loaded = self._models.get(model_name_or_path)
+
+            if loaded is None or not loaded[0].retargetable:
+                translator = self.translator_factory(model_name_or_path, source_lang, target_lang)
+                lock = threading.Lock()
+            else:
+                # Share the already loaded weights across language pairs
+                translator = copy.copy(loaded[0])
+                translator.source_lang = source_lang
+                translator.target_lang = target_lang
+                lock = loaded[1]
+
+            with self._load_lock:
+                self._check_open()
+                if loaded is None:
+                    self._models[model_name_or_path] = (translator, lock)
+                batcher = _Batcher(translator, lock, self.max_batch_size, self.max_latency)
+                self._batchers[key] = batcher
+            return batcher
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("Translation server is shutting down")
+
+    def serve_forever(self) -> None:
+        """Serve requests until shutdown is called"""
+        self._httpd.serve_forever()
+
+    def start(self) -> "TranslationServer":
+        """Serve requests from a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        """Stop serving requests, fail any pending requests and release the socket"""
+        with self._load_lock:
+            self._closed = True
+            batchers = list(self._batchers.values())
+            self._batchers = {}
+
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+        for batcher in batchers:
+            batcher.close()
+
+    def __enter__(self) -> "TranslationServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+
+
+class ServerTranslator(BaseTranslator):
+    """ServerTranslator sends documents to a local TranslationServer so several
+    jobs can share a single resident copy of a model."""
+
+    name = "server"
+
+    def __init__(
+        self,
+        model_name_or_path: str,
+        source_lang: str,
+        target_lang: str,
+        translate_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Initialize an instance of ServerTranslator
+
+        Args:
+            model_name_or_path (str): Model name or path the server should translate with
+                e.g. "Helsinki-NLP/opus-mt-en-ROMANCE"
+            source_lang (str, optional): Source language to translate from
+            target_lang (str, optional): Language to translate to
+            translate_url (str, optional): URL of the running TranslationServer.
+                Defaults to the default `dstl serve` address.
+            timeout (float, optional): Request timeout in seconds.
+                Defaults to no timeout since the first request may load a model.
+        """
+        self.model_name_or_path = model_name_or_path
+        self._translate_url = (translate_url or DEFAULT_URL).rstrip("/") + "/translate"
+        self._timeout = timeout
+
+        super().__init__(source_lang, target_lang)
+
+    def _predict(self, texts: List[str], batch_size: Optional[int] = 8) -> Iterable[str]:
+
+        translated_texts = []
+        with tqdm(total=len(texts)) as pbar:
+            for batch in minibatch(texts, batch_size):
+                json_body = {
+                    "model_name_or_path": self.model_name_or_path,
+                    "source_lang": self.source_lang,
+                    "target_lang": self.target_lang,
+                    "texts": list(batch),
+                }
+                res = httpx.post(self._translate_url, json=json_body, timeout=self._timeout)
+                if res.status_code != 200:
+                    try:
+                        error = res.json()["error"]
+                    except (ValueError, KeyError, TypeError):
+                        error = res.text
+                    raise RuntimeError(
+                        f"Translation server returned status {res.status_code}: {error}"
+                    )
+                data = res.json()
+                translated_texts += data["translations"]
+                pbar.update(len(batch))
+
+        return translated_texts
@@ -12,8 +12,15 @@ class TransformersMarianTranslator(BaseTranslator):
     to translate text to/from any supported model in Marian MT."""
 
     name = "transformers"
-
-    def __init__(self, model_name_or_path: str, source_lang: str, target_lang: str):
+    retargetable = True
+
+    def __init__(
+        self,
+        model_name_or_path: str,
+        source_lang: str,
+        target_lang: str,
+        show_progress: bool = True,
+    ):
         """Initialize an instance of TransformersMarianTranslator
 
         Args:
@@ -21,6 +28,7 @@ class TransformersMarianTranslator(BaseTranslator):
                 e.g. "Helsinki-NLP/opus-mt-en-ROMANCE"
             source_lang (str, optional): Source language to translate from
             target_lang (str, optional): Language to translate to
+            show_progress (bool, optional): Show tqdm progress bar while translating
 
         Raises:
             ValueError: Target language is ambiguous given the model and no target_lang 
@@ -28,6 +36,7 @@ class TransformersMarianTranslator(BaseTranslator):
         """
         self.tokenizer = MarianTokenizer.from_pretrained(model_name_or_path)
         self.model = MarianMTModel.from_pretrained(model_name_or_path)
+        self.show_progress = show_progress
         super().__init__(source_lang, target_lang)
 
     def _predict(self, texts: List[str], batch_size: Optional[int] = 8) -> Iterable[str]:
@@ -42,7 +51,7 @@ class TransformersMarianTranslator(BaseTranslator):
         """
         prefix = f">>{self.target_lang}<< "
         texts = [prefix + text for text in texts]
-        with tqdm(total=len(texts)) as pbar:
+        with tqdm(total=len(texts), disable=not self.show_progress) as pbar:
             for batch in minibatch(texts, batch_size):
                 encoded_inputs = self.tokenizer.prepare_translation_batch(batch)
                 translated = self.model.generate(**encoded_inputs)
@@ -11,6 +11,7 @@ class Task(str, Enum):
 class Translator(str, Enum):
     AZURE = "azure"
     GOOGLE = "google"
+    SERVER = "server"
     TRANSFORMERS = "transformers"
 
 
@@ -0,0 +1,29 @@
+import importlib
+from typing import Any, List
+
+from typer.testing import CliRunner
+
+from dstl.cli import app
+from dstl.translate.server import TranslationServer
+
+runner = CliRunner()
+
+
+def test_serve_without_options(monkeypatch):
+    served: List[TranslationServer] = []
+
+    class RecordingTranslationServer(TranslationServer):
+        def __init__(self, **kwargs: Any):
+            super().__init__(**{**kwargs, "port": 0})
+
+        def serve_forever(self) -> None:
+            served.append(self)
+
+    serve_module = importlib.import_module("dstl.cli.serve")
+    monkeypatch.setattr(serve_module, "TranslationServer", RecordingTranslationServer)
+
+    result = runner.invoke(app, ["serve"])
+
+    assert result.exit_code == 0, result.output
+    assert len(served) == 1
+    assert served[0].loaded_models == []
@@ -0,0 +1,221 @@
+import threading
+from typing import Iterable, List, Optional
+
+import httpx
+import pytest
+
+from dstl.translate.base import BaseTranslator
+from dstl.translate.server import ServerTranslator, TranslationServer
+
+
+class UpperTranslator(BaseTranslator):
+    """Offline translator that upper cases text and records the batches it sees"""
+
+    name = "upper"
+    retargetable = True
+
+    def __init__(self, model_name_or_path: str, source_lang: str, target_lang: str):
+        self.batches: List[List[str]] = []
+        super().__init__(source_lang, target_lang)
+
+    def _predict(self, texts: List[str], batch_size: Optional[int] = 8) -> Iterable[str]:
+        self.batches.append(list(texts))
+        return [f"{self.target_lang}:{text.upper()}" for text in texts]
+
+
+def test_server_translator():
+    with TranslationServer(port=0, translator_factory=UpperTranslator) as server:
+        translator = ServerTranslator(
+            "upper", source_lang="en", target_lang="es", translate_url=server.url
+        )
+        texts = ["one", "two", "three"]
+
+        assert list(translator.pipe(texts, batch_size=2)) == ["es:ONE", "es:TWO", "es:THREE"]
+        assert translator("four") == "es:FOUR"
+        assert server.loaded_models == ["upper"]
+
+
+def test_server_coalesces_concurrent_requests():
+    loaded: List[UpperTranslator] = []
+
+    def factory(model_name_or_path: str, source_lang: str, target_lang: str) -> BaseTranslator:
+        translator = UpperTranslator(model_name_or_path, source_lang, target_lang)
+        loaded.append(translator)
+        return translator
+
+    with TranslationServer(
+        port=0, max_batch_size=64, max_latency=0.5, translator_factory=factory
+    ) as server:
+        server.load("upper", "en", "es")
+        results = {}
+
+        def client(i: int) -> None:
+            translator = ServerTranslator(
+                "upper", source_lang="en", target_lang="es", translate_url=server.url
+            )
+            results[i] = list(translator.pipe([f"text {i}"]))
+
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert results == {i: [f"es:TEXT {i}"] for i in range(4)}
+    assert len(loaded) == 1
+    assert len(loaded[0].batches) < 4
+    assert sum(len(b) for b in loaded[0].batches) == 4
+
+
+def test_server_loading_model_does_not_block_loaded_models():
+    slow_loading = threading.Event()
+    release_slow = threading.Event()
+
+    def factory(model_name_or_path: str, source_lang: str, target_lang: str) -> BaseTranslator:
+        if model_name_or_path == "slow":
+            slow_loading.set()
+            release_slow.wait()
+        return UpperTranslator(model_name_or_path, source_lang, target_lang)
+
+    with TranslationServer(port=0, translator_factory=factory) as server:
+        server.load("fast", "en", "es")
+
+        slow_results = []
+        slow_client = threading.Thread(
+            target=lambda: slow_results.append(server.translate(["slow"], "slow", "en", "es")),
+            daemon=True,
+        )
+        slow_client.start()
+        try:
+            assert slow_loading.wait(5)
+
+            translator = ServerTranslator(
+                "fast", source_lang="en", target_lang="es", translate_url=server.url, timeout=5
+            )
+            assert translator("fast") == "es:FAST"
+        finally:
+            release_slow.set()
+        slow_client.join(5)
+
+    assert slow_results == [["es:SLOW"]]
+
+
+def test_server_shutdown_fails_new_requests():
+    server = TranslationServer(port=0, translator_factory=UpperTranslator).start()
+    server.load("upper", "en", "es")
+    server.shutdown()
+
+    with pytest.raises(RuntimeError, match="shutting down"):
+        server.translate(["text"], "upper", "en", "es")
+
+
+def test_server_shares_weights_across_language_pairs():
+    loaded: List[UpperTranslator] = []
+
+    def factory(model_name_or_path: str, source_lang: str, target_lang: str) -> BaseTranslator:
+        translator = UpperTranslator(model_name_or_path, source_lang, target_lang)
+        loaded.append(translator)
+        return translator
+
+    with TranslationServer(port=0, translator_factory=factory) as server:
+        assert server.translate(["text"], "upper", "en", "es") == ["es:TEXT"]
+        assert server.translate(["text"], "upper", "en", "fr") == ["fr:TEXT"]
+
+    assert len(loaded) == 1
+
+
+def test_server_loads_non_retargetable_translator_per_language_pair():
+    class FixedTranslator(UpperTranslator):
+        retargetable = False
+
+    loaded: List[BaseTranslator] = []
+
+    def factory(model_name_or_path: str, source_lang: str, target_lang: str) -> BaseTranslator:
+        translator = FixedTranslator(model_name_or_path, source_lang, target_lang)
+        loaded.append(translator)
+        return translator
+
+    with TranslationServer(port=0, translator_factory=factory) as server:
+        assert server.translate(["text"], "fixed", "en", "es") == ["es:TEXT"]
+        assert server.translate(["text"], "fixed", "en", "fr") == ["fr:TEXT"]
+
+    assert len(loaded) == 2
+
+
+def test_server_translator_error():
+    def factory(model_name_or_path: str, source_lang: str, target_lang: str) -> BaseTranslator:
+        raise ValueError(f"Unknown model '{model_name_or_path}'")
+
+    with TranslationServer(port=0, translator_factory=factory) as server:
+        res = httpx.post(
+            f"{server.url}/translate",
+            json={
+                "model_name_or_path": "missing",
+                "source_lang": "en",
+                "target_lang": "es",
+                "texts": ["text"],
+            },
+        )
+        assert res.status_code == 500
+        assert res.json() == {"error": "Unknown model 'missing'"}
+
+        translator = ServerTranslator(
+            "missing", source_lang="en", target_lang="es", translate_url=server.url
+        )
+        with pytest.raises(RuntimeError, match="500: Unknown model 'missing'"):
+            translator("text")
+
+
+def test_server_invalid_request_body():
+    with TranslationServer(port=0, translator_factory=UpperTranslator) as server:
+        res = httpx.post(
+            f"{server.url}/translate",
+            json={
+                "model_name_or_path": "upper",
+                "source_lang": "en",
+                "target_lang": "es",
+                "texts": "text",
+            },
+        )
+        assert res.status_code == 400
+        assert "texts must be a list of strings" in res.json()["error"]
+
+        res = httpx.post(f"{server.url}/translate", json={"texts": ["text"]})
+        assert res.status_code == 400
+
+
+def test_server_health():
+    with TranslationServer(port=0, translator_factory=UpperTranslator) as server:
+        server.load("upper", "en", "es")
+        res = httpx.get(f"{server.url}/health")
+
+    assert res.status_code == 200
+    assert res.json() == {"status": "ok", "models": ["upper"]}
+
+
+def test_server_max_batch_size():
+    loaded: List[UpperTranslator] = []
+
+    def factory(model_name_or_path: str, source_lang: str, target_lang: str) -> BaseTranslator:
+        translator = UpperTranslator(model_name_or_path, source_lang, target_lang)
+        loaded.append(translator)
+        return translator
+
+    with TranslationServer(
+        port=0, max_batch_size=2, max_latency=1.0, translator_factory=factory
+    ) as server:
+        server.load("upper", "en", "es")
+        results = {}
+
+        def client(i: int) -> None:
+            results[i] = server.translate([f"text {i}"], "upper", "en", "es")
+
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert results == {i: [f"es:TEXT {i}"] for i in range(6)}
+    assert all(len(b) <= 2 for b in loaded[0].batches)
+    assert sum(len(b) for b in loaded[0].batches) == 6